@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import os
 import re
 import sys
@@ -8,13 +9,24 @@ import random
 import base64
 import subprocess
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import shutil
 import json
+import sqlite3
+import stat
+import unicodedata
 import argparse
+import logging
+import hashlib
+import tempfile
+import functools
+import threading
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from queue import Queue, Empty
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, parse_qs
 
 import yt_dlp
 from mutagen.oggopus import OggOpus
@@ -22,6 +34,7 @@ from mutagen.flac import Picture
 import musicbrainzngs
 
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.progress import (
     Progress,
@@ -34,6 +47,7 @@ from rich.progress import (
 )
 
 console = Console()
+log = logging.getLogger("yt-music-dl")
 
 # YOU NEED THIS TO MAKE METADATA REQUESTS
 # GET YOUR FREE API KEY FROM: https://acoustid.org/
@@ -45,7 +59,18 @@ musicbrainzngs.set_useragent(
     "https://github.com/Heropowwa/YT-MUSIC-DL"
 )
 
-REMOVE_WORDS = {
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "yt-music-dl")
+COVER_CACHE_DIR = os.path.join(CACHE_DIR, "covers")
+MAX_COVER_BYTES = 4 * 1024 * 1024
+METADATA_CACHE_PATH = os.path.join(CACHE_DIR, "cache.sqlite")
+# Cached answers are reused for 30 days; "nothing found" answers for 7.
+METADATA_TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 7 * 24 * 3600
+# iTunes serves any square size; 600px is plenty for players and a fraction
+# of the bytes of the 1400px original.
+DEFAULT_COVER_SIZE = 600
+
+REMOVE_WORDS = frozenset({
     "feat", "ft", "featuring", "with",
     "remaster", "remastered", "remastering",
     "live", "edit", "edition", "version", "mix", "mono", "stereo",
@@ -63,23 +88,60 @@ REMOVE_WORDS = {
     "cover", "tribute",
     "intro", "outro", "interlude",
     "official", "video", "audio"
-}
+})
 
 BRACKETS_RE = re.compile(r'[\(\[\{].*?[\)\]\}]', re.UNICODE)
-CLEAN_RE = re.compile(r"[^\w\s']", re.UNICODE)
+# Anything that is not a word character or an apostrophe separates tokens.
+TOKEN_RE = re.compile(r"[\w']+", re.UNICODE)
+ARTIST_SPLIT_RE = re.compile(r",|&| feat\.?| featuring ", re.IGNORECASE)
+# \w is exactly str.isalnum() plus "_", so this keeps the same characters the
+# old per-character filter did.
+UNSAFE_FILENAME_RE = re.compile(r"[^\w \-().]", re.UNICODE)
 
 def sanitize_filename(name: str) -> str:
-    return "".join(c if c.isalnum() or c in " _-()." else "_" for c in name).strip()
+    return UNSAFE_FILENAME_RE.sub("_", name).strip()
+
+def fold_accents(s: str) -> str:
+    if s.isascii():
+        return s
+    # NFKD also folds full-width forms and ligatures. Accents are only dropped
+    # from Latin letters: stripping combining marks everywhere would turn e.g.
+    # Japanese dakuten kana into different characters.
+    out = []
+    prev_ascii = False
+    for c in unicodedata.normalize("NFKD", s):
+        if prev_ascii and unicodedata.combining(c):
+            continue
+        out.append(c)
+        prev_ascii = c.isascii()
+    return unicodedata.normalize("NFC", "".join(out))
 
+# Album and artist strings repeat across every track of a playlist.
+@functools.lru_cache(maxsize=2048)
 def normalize_string(s: str) -> str:
     if not s:
         return ""
-    s = BRACKETS_RE.sub(" ", s)
-    s = s.lower()
-    s = s.replace("&", " and ")
-    s = CLEAN_RE.sub(" ", s)
-    words = [w for w in s.split() if w not in REMOVE_WORDS]
-    return " ".join(words)
+    s = fold_accents(s)
+    s = BRACKETS_RE.sub(" ", s).lower().replace("&", " and ")
+    return " ".join(w for w in TOKEN_RE.findall(s) if w not in REMOVE_WORDS)
+
+def is_valid_file(path: str, min_size: int = 1024) -> bool:
+    # One stat() instead of isfile() followed by getsize().
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size >= min_size
+
+def is_finished_download(path: str) -> bool:
+    # insert_metadata always writes the track number, so its presence means
+    # the file survived extraction and a tagging pass.
+    if not is_valid_file(path):
+        return False
+    try:
+        return "tracknumber" in OggOpus(path)
+    except Exception:
+        return False
 
 def create_output_folder(base_path: str, name: str) -> str:
     safe_name = sanitize_filename(name)
@@ -87,44 +149,368 @@ def create_output_folder(base_path: str, name: str) -> str:
     os.makedirs(folder_path, exist_ok=True)
     return folder_path
 
-def retry_request(func, max_retries=3, backoff_factor=2, *args, **kwargs):
+DEFAULT_DOMAIN_DELAY_MS = 200
+
+DEFAULT_DOMAIN_BURST = 4
+YOUTUBE_HOST = "www.youtube.com"
+
+class DomainRateLimiter:
+    # Per-host token bucket, implemented as a virtual schedule: each host
+    # refills one token every min_interval and holds at most `burst` tokens.
+    def __init__(self, min_interval_ms: int = DEFAULT_DOMAIN_DELAY_MS, burst: int = DEFAULT_DOMAIN_BURST):
+        self.configure(min_interval_ms, burst)
+        self._schedule = {}
+        self._lock = threading.Lock()
+
+    def configure(self, min_interval_ms: int, burst: int):
+        self.min_interval = max(0, min_interval_ms) / 1000
+        self.burst = max(1, burst)
+
+    def wait(self, host: str):
+        if self.min_interval <= 0:
+            return
+        # Reserve this request's start time under the lock, then sleep
+        # outside it so workers talking to other hosts are not held up.
+        with self._lock:
+            now = time.monotonic()
+            tolerance = (self.burst - 1) * self.min_interval
+            due = max(now, self._schedule.get(host, now))
+            start = max(now, due - tolerance)
+            self._schedule[host] = due + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+RATE_LIMITER = DomainRateLimiter()
+
+# One pooled session for every metadata host so TLS connections are kept
+# alive across tracks and shared between worker threads.
+SESSION = requests.Session()
+# Transient failures are retried inside urllib3, which also honours
+# Retry-After on 429/503. raise_on_status=False hands the last response back
+# so callers still see the real status through raise_for_status().
+HTTP_RETRIES = Retry(
+    total=3,
+    backoff_factor=1.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+def size_session_pool(workers: int):
+    # pool_maxsize is per host. Every worker (plus the cover/lyrics lookups of
+    # playlist neighbours) can hold a connection to the same host, and
+    # requests beyond the pool size open throwaway connections.
+    pool_maxsize = max(32, workers * 2)
+    for scheme in ("https://", "http://"):
+        SESSION.mount(scheme, HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=HTTP_RETRIES))
+
+size_session_pool(1)
+SESSION.headers.update({
+    "User-Agent": "YT_Audio_Downloader/1.1 (+https://github.com/Heropowwa/YT-MUSIC-DL)",
+    "Accept-Encoding": "gzip, deflate",
+})
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = {}
+        self._open_until = {}
+        self._trial = set()
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str):
+        with self._lock:
+            until = self._open_until.get(host)
+            if until is None:
+                return
+            if time.monotonic() < until or host in self._trial:
+                raise CircuitOpenError(f"{host} is failing, skipping request")
+            # Half-open: let a single trial request through.
+            self._trial.add(host)
+
+    def record(self, host: str, ok: bool):
+        with self._lock:
+            was_trial = host in self._trial
+            self._trial.discard(host)
+            if ok:
+                self._failures.pop(host, None)
+                self._open_until.pop(host, None)
+                return
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if was_trial or failures >= self.failure_threshold:
+                # Warn once here; the requests it then skips only go to the debug log.
+                if not was_trial:
+                    console.print(f"[yellow]{host} keeps failing; skipping it for {self.reset_timeout:.0f}s.[/yellow]")
+                self._open_until[host] = time.monotonic() + self.reset_timeout
+
+BREAKER = CircuitBreaker()
+
+# In-flight request caps for the metadata APIs every worker hits per track.
+HOST_CONCURRENCY = {
+    "lrclib.net": 4,
+    "itunes.apple.com": 8,
+}
+
+class HostConcurrencyLimiter:
+    # A 429 drops the host to one request at a time for `throttled_for`
+    # seconds, so the other workers queue up here instead of each running
+    # into the limit and backing off on their own.
+    def __init__(self, limits: dict, throttled_for: float = 30.0):
+        self.limits = dict(limits)
+        self.throttled_for = throttled_for
+        self._active = {}
+        self._throttled_until = {}
+        self._cond = threading.Condition()
+
+    def acquire(self, host: str):
+        if host not in self.limits:
+            return
+        with self._cond:
+            while True:
+                remaining = self._throttled_until.get(host, 0) - time.monotonic()
+                limit = 1 if remaining > 0 else self.limits[host]
+                if self._active.get(host, 0) < limit:
+                    break
+                self._cond.wait(remaining if remaining > 0 else None)
+            self._active[host] = self._active.get(host, 0) + 1
+
+    def release(self, host: str, throttled: bool = False):
+        if host not in self.limits:
+            return
+        with self._cond:
+            self._active[host] -= 1
+            if throttled:
+                self._throttled_until[host] = time.monotonic() + self.throttled_for
+            self._cond.notify_all()
+
+HOST_LIMITER = HostConcurrencyLimiter(HOST_CONCURRENCY)
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    host = urlparse(url).netloc
+    # A host that keeps failing is skipped for a while instead of making
+    # every remaining track sit through its own timeouts and retries.
+    BREAKER.before_request(host)
+    # Every outcome is recorded, exceptions of any kind included, so a failed
+    # half-open trial can never leave the host stuck in the breaker.
+    ok = throttled = False
+    try:
+        HOST_LIMITER.acquire(host)
+        try:
+            RATE_LIMITER.wait(host)
+            response = SESSION.get(url, **kwargs)
+            throttled = response.status_code == 429
+            ok = response.status_code < 500 and not throttled
+            return response
+        finally:
+            HOST_LIMITER.release(host, throttled)
+    finally:
+        BREAKER.record(host, ok)
+
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def atomic_write(path: str, data: bytes):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; keep the permissions the target had.
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class MetadataCache:
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS lyrics (key TEXT PRIMARY KEY, synced TEXT, plain TEXT, ts INT)",
+        "CREATE TABLE IF NOT EXISTS artwork (key TEXT PRIMARY KEY, url TEXT, ts INT)",
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+                for statement in self.SCHEMA:
+                    conn.execute(statement)
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                console.print(f"[yellow]Metadata cache disabled: {e}[/yellow]")
+                self._disabled = True
+        return self._conn
+
+    def _fetchone(self, sql: str, params: tuple) -> Optional[tuple]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                return conn.execute(sql, params).fetchone()
+            except sqlite3.Error:
+                return None
+
+    def _write(self, sql: str, params: tuple):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(sql, params)
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def get_lyrics(self, key: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        row = self._fetchone("SELECT synced, plain, ts FROM lyrics WHERE key = ?", (key,))
+        if not row:
+            return None
+        synced, plain, ts = row
+        # "No lyrics" answers expire sooner so tracks added to LRCLib later get picked up.
+        ttl = METADATA_TTL if synced or plain else NEGATIVE_TTL
+        if time.time() - (ts or 0) > ttl:
+            return None
+        return synced, plain
+
+    def put_lyrics(self, key: str, synced: Optional[str], plain: Optional[str]):
+        self._write(
+            "INSERT OR REPLACE INTO lyrics (key, synced, plain, ts) VALUES (?, ?, ?, ?)",
+            (key, synced, plain, int(time.time()))
+        )
+
+    def get_artwork(self, key: str) -> Optional[str]:
+        # Returns "" for a cached "no artwork" answer and None on a cache miss.
+        row = self._fetchone("SELECT url, ts FROM artwork WHERE key = ?", (key,))
+        if not row:
+            return None
+        url, ts = row
+        ttl = METADATA_TTL if url else NEGATIVE_TTL
+        if time.time() - (ts or 0) > ttl:
+            return None
+        return url or ""
+
+    def put_artwork(self, key: str, url: Optional[str]):
+        self._write(
+            "INSERT OR REPLACE INTO artwork (key, url, ts) VALUES (?, ?, ?)",
+            (key, url or "", int(time.time()))
+        )
+
+METADATA_CACHE = MetadataCache(METADATA_CACHE_PATH)
+
+class RequestCoalescer:
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def run(self, key, func, *args):
+        # Concurrent callers asking for the same key share a single call:
+        # the first one performs it, the rest block on its Future.
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if not owner:
+            return future.result()
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+COVER_REQUESTS = RequestCoalescer()
+LYRICS_REQUESTS = RequestCoalescer()
+
+# yt-dlp errors that no amount of retrying will fix.
+UNRECOVERABLE_ERRORS = (
+    "private video",
+    "video unavailable",
+    "this video is not available",
+    "this video has been removed",
+    "members-only",
+    "sign in to confirm your age",
+)
+
+def is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, requests.exceptions.HTTPError):
+        status = exc.response.status_code if exc.response is not None else 0
+        return status == 429 or status >= 500
+    if isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(exc, (yt_dlp.utils.DownloadError, yt_dlp.utils.ExtractorError)):
+        message = str(exc).lower()
+        return not any(marker in message for marker in UNRECOVERABLE_ERRORS)
+    return True
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    # "Full jitter": spreads workers that failed together across the whole
+    # window instead of waking them all within the same second.
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+def retry_request(func, max_retries=3, base=1.0, cap=30.0, *args, **kwargs):
     for attempt in range(1, max_retries + 1):
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            if attempt == max_retries:
+            if attempt == max_retries or not is_retryable(e):
                 raise
-            wait = backoff_factor ** attempt + random.uniform(0, 1)
-            console.print(f"[yellow]Attempt {attempt} failed: {e}. Retrying in {wait:.1f}s...[/yellow]")
+            wait = backoff_delay(attempt, base, cap)
+            log.info("Attempt %d failed: %s. Retrying in %.1fs...", attempt, e, wait)
             time.sleep(wait)
 
-def convert_to_opus(input_path: str, output_path: str):
-    if not shutil.which("ffmpeg"):
-        raise RuntimeError("FFmpeg not found. Please install FFmpeg.")
-    command = [
-        "ffmpeg", "-y", "-i", input_path,
-        "-vn", "-acodec", "libopus", "-b:a", "192k",
-        output_path
-    ]
-    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if result.returncode != 0:
-        raise RuntimeError(f"FFmpeg conversion failed:\n{result.stderr.decode()}")
-    if not os.path.isfile(output_path) or os.path.getsize(output_path) < 1024:
-        raise RuntimeError("Converted Opus file missing or too small.")
+def save_tags(audio: OggOpus, opus_path: str):
+    # Growing the comment header makes mutagen shift every following Ogg page
+    # with many small reads and writes; do that against an in-memory copy and
+    # write the result back in one go.
+    with open(opus_path, "rb") as f:
+        buf = io.BytesIO(f.read())
+    audio.save(buf)
+    atomic_write(opus_path, buf.getvalue())
 
 def get_duration_seconds(opus_path: str) -> int:
     return int(OggOpus(opus_path).info.length)
 
+# Resolved once at import; the PATH walk is not repeated for every track.
+FFMPEG = shutil.which("ffmpeg")
+FPCALC = shutil.which("fpcalc")
+
 def generate_local_fingerprint(file_path: str) -> Tuple[Optional[str], Optional[int]]:
-    if not shutil.which("fpcalc"):
-        console.print("[yellow]Warning: 'fpcalc' binary not found in PATH. Cannot generate fingerprint.[/yellow]")
+    if not FPCALC:
         return None, None
 
     try:
         result = subprocess.run(
-            ["fpcalc", "-json", file_path],
+            [FPCALC, "-json", file_path],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -143,7 +529,7 @@ def get_metadata_via_picard_method(audio_path: str) -> dict:
         return {}
 
     try:
-        response = requests.get(
+        response = http_get(
             "https://api.acoustid.org/v2/lookup",
             params={
                 "client": ACOUSTID_API_KEY,
@@ -189,11 +575,14 @@ def get_metadata_via_picard_method(audio_path: str) -> dict:
 
         return {k: v for k, v in tags.items() if v}
 
+    except CircuitOpenError as e:
+        log.debug("Picard-style metadata lookup skipped: %s", e)
+        return {}
     except Exception as e:
         console.print(f"[yellow]Picard-style metadata lookup failed: {e}[/yellow]")
         return {}
 
-def get_apple_cover(album_name, artist_name, track_name=None):
+def get_apple_cover(album_name, artist_name, track_name=None, cover_size=DEFAULT_COVER_SIZE):
     # 1. Strip out "Unknown" defaults that pollute the iTunes search
     if album_name and "unknown" in album_name.lower():
         album_name = ""
@@ -202,6 +591,21 @@ def get_apple_cover(album_name, artist_name, track_name=None):
     if track_name and "unknown" in track_name.lower():
         track_name = ""
 
+    try:
+        artwork = _apple_artwork_cached(track_name or "", artist_name or "", album_name or "")
+    except Exception:
+        return None
+    return artwork.replace("100x100bb", f"{cover_size}x{cover_size}bb") if artwork else None
+
+# Same pattern as _fetch_lyrics_cached: a lookup that hit a network error
+# raises, so only real answers (including "no artwork") are memoised.
+@functools.lru_cache(maxsize=512)
+def _apple_artwork_cached(track_name: str, artist_name: str, album_name: str) -> Optional[str]:
+    cache_key = hashlib.sha1(f"itunes|{track_name}|{artist_name}|{album_name}".encode("utf-8")).hexdigest()
+    cached = METADATA_CACHE.get_artwork(cache_key)
+    if cached is not None:
+        return cached or None
+
     # 2. Build a robust list of fallback queries
     queries = []
 
@@ -221,6 +625,7 @@ def get_apple_cover(album_name, artist_name, track_name=None):
         queries.append(artist_name)
 
     # 3. Try each query until iTunes returns a result
+    lookup_error = None
     for query in queries:
         query = query.strip()
         if not query:
@@ -234,64 +639,153 @@ def get_apple_cover(album_name, artist_name, track_name=None):
             "explicit": "Yes",
         }
         try:
-            response = requests.get("https://itunes.apple.com/search", params=params, timeout=10)
+            response = http_get("https://itunes.apple.com/search", params=params, timeout=10)
             response.raise_for_status()
             results = response.json().get("results", [])
 
             # If we got a hit, return the high-res artwork immediately
             if results and results[0].get("artworkUrl100"):
-                return results[0].get("artworkUrl100").replace("100x100bb", "1400x1400bb")
-        except Exception:
-            pass # Ignore connection errors and try the next fallback query
+                artwork = results[0].get("artworkUrl100")
+                METADATA_CACHE.put_artwork(cache_key, artwork)
+                return artwork
+        except Exception as e:
+            lookup_error = e # Ignore connection errors and try the next fallback query
 
+    # Only remember "no artwork" when every query actually got an answer.
+    if lookup_error is not None:
+        raise lookup_error
+    METADATA_CACHE.put_artwork(cache_key, None)
     return None
 
+@functools.lru_cache(maxsize=32)
+def get_cover(thumb_url: str) -> Tuple[bytes, str]:
+    key = hashlib.sha1(thumb_url.encode("utf-8")).hexdigest()
+    data_path = os.path.join(COVER_CACHE_DIR, f"{key}.bin")
+    mime_path = os.path.join(COVER_CACHE_DIR, f"{key}.mime")
+
+    try:
+        with open(data_path, "rb") as f:
+            img_data = f.read()
+        with open(mime_path, "r", encoding="ascii") as f:
+            mime = f.read().strip()
+        if img_data and mime:
+            return img_data, mime
+    except OSError:
+        pass
+
+    # Artwork is already compressed: ask for it as-is and read the body
+    # straight off the socket instead of buffering it through .content.
+    response = http_get(thumb_url, timeout=10, stream=True, headers={"Accept-Encoding": "identity"})
+    with response:
+        response.raise_for_status()
+        declared_size = int(response.headers.get("Content-Length") or 0)
+        if declared_size > MAX_COVER_BYTES:
+            raise ValueError(f"cover art too large ({declared_size} bytes)")
+        img_data = response.raw.read(MAX_COVER_BYTES + 1, decode_content=True)
+        if len(img_data) > MAX_COVER_BYTES:
+            raise ValueError("cover art too large")
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+
+    # Trust the server's type; the URL suffix says nothing for iTunes' ".../600x600bb".
+    if content_type.startswith("image/"):
+        mime = content_type
+    else:
+        mime = "image/png" if thumb_url.lower().endswith(".png") else "image/jpeg"
+
+    try:
+        atomic_write(data_path, img_data)
+        atomic_write(mime_path, mime.encode("ascii"))
+    except OSError as e:
+        console.print(f"[yellow]Could not cache cover art: {e}[/yellow]")
+
+    return img_data, mime
+
+def fetch_cover_bytes(album: str, artist: str, title: str, cover_size: int = DEFAULT_COVER_SIZE,
+                      normalized: bool = False) -> Optional[Tuple[bytes, str]]:
+    if not normalized:
+        album, artist, title = normalize_string(album), normalize_string(artist), normalize_string(title)
+    try:
+        thumb_url = get_apple_cover(album, artist, title, cover_size)
+    except Exception:
+        thumb_url = None
+
+    if not thumb_url:
+        return None
+
+    try:
+        return COVER_REQUESTS.run(thumb_url, get_cover, thumb_url)
+    except CircuitOpenError as e:
+        log.debug("Cover download skipped: %s", e)
+        return None
+    except Exception as e:
+        console.print(f"[yellow]Could not embed Apple Cover art: {e}[/yellow]")
+        return None
+
 TIMESTAMP_RE = re.compile(r"\[\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?\]")
 
-def fetch_lyrics(artist: str, title: str, album: str, duration: int, retries: int = 2, timeout: int = 20) -> Tuple[Optional[str], Optional[str]]:
-    artist_clean = normalize_string(artist)
-    title_clean = normalize_string(title)
-    album_clean = normalize_string(album)
-    if album_clean == "unknown album":
-        album_clean = ""
+def search_lrclib(params: dict, timeout: int) -> Tuple[Optional[str], Optional[str]]:
+    log.debug("lyrics params: %s", params)
+    response = http_get(
+        "https://lrclib.net/api/search",
+        params=params,
+        timeout=timeout
+    )
+    response.raise_for_status()
+    data = response.json()
+    if not data or not isinstance(data, list):
+        return None, None
+    for r in data:
+        synced = r.get("syncedLyrics")
+        if synced and TIMESTAMP_RE.search(synced.strip()):
+            return synced.strip(), r.get("plainLyrics")
+    for r in data:
+        plain = r.get("plainLyrics")
+        if plain and plain.strip():
+            return None, plain.strip()
+    return None, None
+
+# Network failures raise and are therefore never memoised; only completed
+# lookups (including "no lyrics found") end up in the LRU cache.
+@functools.lru_cache(maxsize=1024)
+def _fetch_lyrics_cached(artist: str, title: str, album: str, duration: int, timeout: int) -> Tuple[Optional[str], Optional[str]]:
+    key = hashlib.blake2b(f"{artist}|{title}|{album}|{duration}".encode("utf-8"), digest_size=16).hexdigest()
+    cached = METADATA_CACHE.get_lyrics(key)
+    if cached is not None:
+        return cached
+
     params = {
-        "track_name": title_clean,
-        "artist_name": artist_clean,
-        "album_name": album_clean,
+        "track_name": title,
+        "artist_name": artist,
+        "album_name": album,
         "duration": str(duration),
     }
-    last_exception = None
-    for attempt in range(retries + 1):
-        try:
-            response = requests.get(
-                "https://lrclib.net/api/search",
-                params=params,
-                timeout=timeout,
-                headers={"User-Agent": "SpotifyLyricsFetcher/1.0"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            if not data or not isinstance(data, list):
-                return None, None
-            for r in data:
-                synced = r.get("syncedLyrics")
-                if synced and TIMESTAMP_RE.search(synced.strip()):
-                    return synced.strip(), r.get("plainLyrics")
-            for r in data:
-                plain = r.get("plainLyrics")
-                if plain and plain.strip():
-                    return None, plain.strip()
-            return None, None
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
-            last_exception = e
-            if attempt < retries:
-                time.sleep(2 ** attempt)
-                continue
-            break
-        except Exception as e:
-            console.print(f"[yellow]Lyrics API error: {e}[/yellow]")
-            return None, None
-    console.print(f"[yellow]Lyrics API failed after retries: {last_exception}[/yellow]")
+    synced, plain = search_lrclib(params, timeout)
+    METADATA_CACHE.put_lyrics(key, synced, plain)
+    return synced, plain
+
+def fetch_lyrics(artist: str, title: str, album: str, duration: int, timeout: int = 20,
+                 normalized: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    if normalized:
+        artist_clean, title_clean, album_clean = artist, title, album
+    else:
+        artist_clean = normalize_string(artist)
+        title_clean = normalize_string(title)
+        album_clean = normalize_string(album)
+    if album_clean == "unknown album":
+        album_clean = ""
+    # LRCLib cannot match a placeholder title or a zero-length track.
+    if title_clean in ("", "unknown title") or duration <= 0:
+        return None, None
+    try:
+        key = (artist_clean, title_clean, album_clean, duration, timeout)
+        return LYRICS_REQUESTS.run(key, _fetch_lyrics_cached, *key)
+    except CircuitOpenError as e:
+        # Nothing was sent; the breaker already warned when it opened.
+        log.debug("Lyrics lookup skipped: %s", e)
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
+        console.print(f"[yellow]Lyrics API failed after retries: {e}[/yellow]")
+    except Exception as e:
+        console.print(f"[yellow]Lyrics API error: {e}[/yellow]")
     return None, None
 
 def save_lrc(lyrics: str, audio_path: str) -> bool:
@@ -300,56 +794,95 @@ def save_lrc(lyrics: str, audio_path: str) -> bool:
     try:
         base_path = os.path.splitext(audio_path)[0]
         lrc_path = f"{base_path}.lrc"
-        with open(lrc_path, "w", encoding="utf-8") as f:
-            f.write(lyrics)
+        # Same bytes a text-mode write would produce, so re-runs can compare.
+        data = lyrics.replace("\n", os.linesep).encode("utf-8")
+        try:
+            with open(lrc_path, "rb") as f:
+                if f.read() == data:
+                    return True
+        except FileNotFoundError:
+            pass
+        atomic_write(lrc_path, data)
         return True
     except Exception as e:
         console.print(f"[red]✗ Failed to write lyrics:[/red] {str(e)}")
         return False
 
-def insert_metadata(opus_path: str, info: dict, track_num: int):
-    try:
-        audio = OggOpus(opus_path)
-    except Exception as e:
-        console.print(f"[red]Could not open Opus file to tag: {e}[/red]")
-        return
+def set_tag(audio: OggOpus, key: str, value: str) -> bool:
+    if audio.get(key) == [value]:
+        return False
+    audio[key] = [value]
+    return True
 
+def track_fields(info: dict) -> Tuple[str, str, str]:
     yt_title = info.get("title", "Unknown Title")
     raw_artist = info.get("artist") or info.get("uploader") or "Unknown Artist"
 
-    yt_artist = re.split(r",|&| feat\.?| featuring ", raw_artist, flags=re.IGNORECASE)[0].strip()
+    yt_artist = ARTIST_SPLIT_RE.split(raw_artist, maxsplit=1)[0].strip()
     yt_artist = yt_artist.replace(" - Topic", "").strip()
 
     yt_album = info.get("album") or "Unknown Album"
-
-    fp_info = get_metadata_via_picard_method(opus_path)
-    for key, val in fp_info.items():
-        audio[key] = [str(val)]
-
-    if 'title' not in audio:
-        audio['title'] = [yt_title]
-    if 'artist' not in audio:
-        audio['artist'] = [yt_artist]
-    if 'album' not in audio:
-        audio['album'] = [yt_album]
-
-    audio['tracknumber'] = [str(track_num)]
-
-    thumb_url = None
+    return yt_title, yt_artist, yt_album
+
+def prefetch_lookups(pool: ThreadPoolExecutor, info: dict, cover_size: int = DEFAULT_COVER_SIZE) -> Tuple[Future, Optional[Future]]:
+    # Cover art and lyrics only need what yt-dlp reported, so they can be
+    # fetched while the audio is still downloading.
+    yt_title, yt_artist, yt_album = track_fields(info)
+    artist_n, title_n, album_n = normalize_string(yt_artist), normalize_string(yt_title), normalize_string(yt_album)
+    cover_future = pool.submit(fetch_cover_bytes, album_n, artist_n, title_n, cover_size, True)
+    lyrics_future = None
+    duration = int(info.get("duration") or 0)
+    if duration:
+        lyrics_future = pool.submit(fetch_lyrics, artist_n, title_n, album_n, duration, normalized=True)
+    return cover_future, lyrics_future
+
+def insert_metadata(opus_path: str, info: dict, track_num: int, cover_size: int = DEFAULT_COVER_SIZE,
+                    prefetched: Optional[Tuple[Future, Optional[Future]]] = None):
     try:
-        thumb_url = get_apple_cover(
-            normalize_string(yt_album),
-            normalize_string(yt_artist),
-            normalize_string(yt_title)
-        )
-    except Exception:
-        thumb_url = None
+        audio = OggOpus(opus_path)
+    except Exception as e:
+        console.print(f"[red]Could not open Opus file to tag: {e}[/red]")
+        return
 
-    if thumb_url:
-        try:
-            response = retry_request(lambda: requests.get(thumb_url, timeout=10), max_retries=3)
-            img_data = response.content
-            mime = "image/png" if thumb_url.lower().endswith(".png") else "image/jpeg"
+    yt_title, yt_artist, yt_album = track_fields(info)
+    # Both lookups query with the same normalised strings.
+    artist_n, title_n, album_n = normalize_string(yt_artist), normalize_string(yt_title), normalize_string(yt_album)
+    prefetched_cover, prefetched_lyrics = prefetched or (None, None)
+
+    # AcoustID, iTunes and LRCLib are independent of each other, so run the
+    # three lookups side by side and only wait for the slowest one.
+    def lookup_lyrics():
+        # yt-dlp already reports the duration; only parse the file when it does not.
+        duration = int(info.get("duration") or 0) or get_duration_seconds(opus_path)
+        return fetch_lyrics(artist_n, title_n, album_n, duration, normalized=True)
+
+    with ThreadPoolExecutor(max_workers=3) as lookups:
+        # Whatever an earlier run already embedded is not looked up again.
+        fp_future = cover_future = lyrics_future = None
+        if "musicbrainz_recordingid" not in audio:
+            fp_future = lookups.submit(get_metadata_via_picard_method, opus_path)
+        if "metadata_block_picture" not in audio:
+            cover_future = prefetched_cover or lookups.submit(fetch_cover_bytes, album_n, artist_n, title_n, cover_size, True)
+        if "lyrics" not in audio:
+            lyrics_future = prefetched_lyrics or lookups.submit(lookup_lyrics)
+
+        dirty = False
+        fp_info = fp_future.result() if fp_future else {}
+        for key, val in fp_info.items():
+            dirty |= set_tag(audio, key, str(val))
+
+        if 'title' not in audio:
+            dirty |= set_tag(audio, 'title', yt_title)
+        if 'artist' not in audio:
+            dirty |= set_tag(audio, 'artist', yt_artist)
+        if 'album' not in audio:
+            dirty |= set_tag(audio, 'album', yt_album)
+
+        dirty |= set_tag(audio, 'tracknumber', str(track_num))
+
+        cover = cover_future.result() if cover_future else None
+        if cover:
+            img_data, mime = cover
 
             pic = Picture()
             pic.data = img_data
@@ -359,24 +892,19 @@ def insert_metadata(opus_path: str, info: dict, track_num: int):
 
             pic_data = pic.write()
             b64_data = base64.b64encode(pic_data).decode("ascii")
-            audio["metadata_block_picture"] = [b64_data]
-        except Exception as e:
-            console.print(f"[yellow]Could not embed Apple Cover art: {e}[/yellow]")
+            dirty |= set_tag(audio, "metadata_block_picture", b64_data)
 
-    try:
-        slyrics, _ = fetch_lyrics(
-            yt_artist,
-            yt_title,
-            yt_album,
-            get_duration_seconds(opus_path)
-        )
-        if slyrics:
-            save_lrc(slyrics, opus_path)
-            audio['lyrics'] = [slyrics]
-    except Exception:
-        pass
+        try:
+            slyrics = lyrics_future.result()[0] if lyrics_future else audio["lyrics"][0]
+            if slyrics:
+                save_lrc(slyrics, opus_path)
+                dirty |= set_tag(audio, 'lyrics', slyrics)
+        except Exception:
+            pass
 
-    audio.save()
+    # Re-runs over an already tagged file usually change nothing; skip the rewrite.
+    if dirty:
+        save_tags(audio, opus_path)
 
 @dataclass
 class SongTask:
@@ -387,10 +915,21 @@ class SongTask:
     title_hint: Optional[str] = None
 
 class WorkerDownloadHook:
+    # yt-dlp fires a progress event per received chunk; the bar only needs a
+    # fraction of those, and every update takes the shared Progress lock.
+    MIN_UPDATE_INTERVAL = 0.1
+    # ...and skip updates that would move the bar by less than 1% (64 KiB floor).
+    MIN_UPDATE_BYTES = 64 * 1024
+
     def __init__(self, progress: Progress, task_id: int):
         self.progress = progress
         self.task_id = task_id
+        self.reset()
+
+    def reset(self):
         self._total_set = False
+        self._last_update = 0.0
+        self._last_bytes = 0
 
     def __call__(self, d):
         status = d.get("status")
@@ -398,6 +937,17 @@ class WorkerDownloadHook:
             total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
             downloaded = d.get("downloaded_bytes") or d.get("downloaded") or 0
 
+            now = time.monotonic()
+            # The event that first reports a total always goes through so the
+            # bar gets its size; the byte gate needs that total to mean anything.
+            if not (total and not self._total_set):
+                if now - self._last_update < self.MIN_UPDATE_INTERVAL:
+                    return
+                if self._total_set and downloaded - self._last_bytes < max(self.MIN_UPDATE_BYTES, total // 100):
+                    return
+            self._last_update = now
+            self._last_bytes = downloaded
+
             if total and not self._total_set:
                 try:
                     self.progress.update(self.task_id, total=total)
@@ -421,129 +971,250 @@ class WorkerDownloadHook:
             except Exception:
                 pass
 
-def build_task_list(urls: List[str], output_dir: str) -> List[SongTask]:
-    tasks: List[SongTask] = []
-    for url in urls:
-        try:
-            with yt_dlp.YoutubeDL({'quiet': True, 'extract_flat': True, 'skip_download': True}) as ydl:
-                info = retry_request(lambda: ydl.extract_info(url, download=False), max_retries=2)
-        except Exception as e:
-            console.print(f"[yellow]Warning: failed to probe {url}: {e}[/yellow]")
-            folder = create_output_folder(output_dir, "Single_Track")
-            tasks.append(SongTask(url=url, folder=folder, index=1, playlist_total=1))
-            continue
+def is_single_video_url(url: str) -> bool:
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().split(":")[0]
+    for prefix in ("www.", "m.", "music."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    query = parse_qs(parsed.query)
+    if "list" in query:
+        return False
+    if host == "youtu.be":
+        return bool(parsed.path.strip("/"))
+    if host == "youtube.com":
+        if parsed.path == "/watch":
+            return bool(query.get("v"))
+        return parsed.path.startswith("/shorts/")
+    return False
+
+PROBE_OPTS = {
+    'quiet': True,
+    'extract_flat': True,
+    'skip_download': True,
+    # The authcheck only matters for private/members-only playlists, and
+    # costs an extra tab request per playlist.
+    'extractor_args': {'youtubetab': {'skip': ['authcheck']}},
+}
 
-        if isinstance(info, dict) and info.get('entries'):
-            playlist_title = info.get('title', f'Playlist_{int(time.time())}')
-            entries = [e for e in info['entries'] if e]
-            folder = create_output_folder(output_dir, playlist_title)
-            console.print(f"[cyan]Playlist:[/cyan] {playlist_title} -> {len(entries)} tracks -> folder: {folder}")
-            for i, entry in enumerate(entries, 1):
-                video_id = entry.get('id')
-                if not video_id:
-                    console.print(f"[yellow]Skipping entry {i}: Missing video ID[/yellow]")
-                    continue
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                title_hint = entry.get('title')
-                tasks.append(SongTask(url=video_url, folder=folder, index=i, playlist_total=len(entries), title_hint=title_hint))
-        else:
-            folder = create_output_folder(output_dir, "Single_Track")
-            hint = None
-            if isinstance(info, dict):
-                hint = info.get('title')
-            tasks.append(SongTask(url=url, folder=folder, index=1, playlist_total=1, title_hint=hint))
+def single_track_task(url: str, output_dir: str, title_hint: Optional[str] = None) -> SongTask:
+    folder = create_output_folder(output_dir, "Single_Track")
+    return SongTask(url=url, folder=folder, index=1, playlist_total=1, title_hint=title_hint)
+
+def probe_url(url: str, output_dir: str, ydl: yt_dlp.YoutubeDL, youtube_slots: threading.Semaphore) -> List[SongTask]:
+    try:
+        def _probe():
+            # Pace before taking a slot so a throttled probe doesn't hold one.
+            RATE_LIMITER.wait(YOUTUBE_HOST)
+            with youtube_slots:
+                return ydl.extract_info(url, download=False)
+
+        info = retry_request(_probe, max_retries=2)
+    except Exception as e:
+        console.print(f"[yellow]Warning: failed to probe {url}: {e}[/yellow]")
+        return [single_track_task(url, output_dir)]
+
+    tasks: List[SongTask] = []
+    if isinstance(info, dict) and info.get('entries'):
+        playlist_title = info.get('title', f'Playlist_{int(time.time())}')
+        entries = [e for e in info['entries'] if e]
+        folder = create_output_folder(output_dir, playlist_title)
+        console.print(f"[cyan]Playlist:[/cyan] {playlist_title} -> {len(entries)} tracks -> folder: {folder}")
+        for i, entry in enumerate(entries, 1):
+            video_id = entry.get('id')
+            if not video_id:
+                console.print(f"[yellow]Skipping entry {i}: Missing video ID[/yellow]")
+                continue
+            video_url = f"https://www.youtube.com/watch?v={video_id}"
+            title_hint = entry.get('title')
+            tasks.append(SongTask(url=video_url, folder=folder, index=i, playlist_total=len(entries), title_hint=title_hint))
+    else:
+        hint = info.get('title') if isinstance(info, dict) else None
+        tasks.append(single_track_task(url, output_dir, hint))
     return tasks
 
-def worker_loop(worker_id: int, job_queue: Queue, progress: Progress, worker_task_id: int, overall_task_id: int):
-    while True:
+def build_task_list(urls: List[str], output_dir: str, youtube_slots: threading.Semaphore,
+                    url_parallel: int = 1) -> List[SongTask]:
+    # Flat-extract every URL up front, reusing a handful of YoutubeDL
+    # instances instead of building one per URL. An instance is never used by
+    # two probes at the same time.
+    idle: Queue = Queue()
+    created: List[yt_dlp.YoutubeDL] = []
+
+    def probe(url: str) -> List[SongTask]:
+        # Plain video URLs are never probed, so they don't need an instance.
+        if is_single_video_url(url):
+            return [single_track_task(url, output_dir)]
         try:
-            song: SongTask = job_queue.get_nowait()
+            ydl = idle.get_nowait()
         except Empty:
-            try:
-                progress.update(worker_task_id, description=f"[grey58]Worker {worker_id} idle[/grey58]", completed=0, total=1)
-            except Exception:
-                pass
-            return
+            ydl = yt_dlp.YoutubeDL(PROBE_OPTS)
+            created.append(ydl)
+        try:
+            return probe_url(url, output_dir, ydl, youtube_slots)
+        finally:
+            idle.put(ydl)
+
+    tasks: List[SongTask] = []
+    try:
+        if url_parallel <= 1 or len(urls) <= 1:
+            for url in urls:
+                tasks.extend(probe(url))
+        else:
+            # Probes share the YouTube semaphore with the download workers; map()
+            # keeps the results in input order so queueing stays deterministic.
+            with ThreadPoolExecutor(max_workers=min(url_parallel, len(urls))) as executor:
+                for url_tasks in executor.map(probe, urls):
+                    tasks.extend(url_tasks)
+    finally:
+        for ydl in created:
+            ydl.close()
+    return tasks
 
-        desc_title = song.title_hint or song.url
-        short_desc = f"W{worker_id} {song.index}/{song.playlist_total} {desc_title}"
+def downloader_options(concurrent_fragments: int, use_aria2c: bool, skip_webpage: bool = False) -> dict:
+    opts = {"concurrent_fragment_downloads": max(1, concurrent_fragments)}
+    if skip_webpage:
+        # Saves the watch-page request per video; yt-dlp warns this can make
+        # extraction less robust, hence opt-in.
+        opts["extractor_args"] = {"youtube": {"player_skip": ["webpage"]}}
+    if use_aria2c:
+        if shutil.which("aria2c"):
+            opts["external_downloader"] = {"default": "aria2c"}
+            opts["external_downloader_args"] = {"aria2c": ["-x", "8", "-s", "8", "-k", "1M"]}
+        else:
+            console.print("[yellow]Warning: 'aria2c' not found in PATH. Using the built-in downloader.[/yellow]")
+    return opts
+
+def worker_loop(worker_id: int, job_queue: Queue, progress: Progress, worker_task_id: int, overall_task_id: int,
+                youtube_slots: threading.Semaphore, download_opts: dict,
+                tag_pool: ThreadPoolExecutor, tag_slots: threading.Semaphore, lookup_pool: ThreadPoolExecutor,
+                cover_size: int = DEFAULT_COVER_SIZE):
+    # One YoutubeDL per worker: extractor/postprocessor setup is paid once and
+    # only the output template changes from song to song.
+    hook = WorkerDownloadHook(progress, worker_task_id)
+
+    def finish(song: SongTask, tagged: Optional[Future] = None):
+        if tagged is not None:
+            tag_slots.release()
+            if tagged.exception() is not None:
+                log.debug("Tagging %s failed: %s", song.url, tagged.exception())
         try:
-            progress.update(worker_task_id, description=short_desc, completed=0, total=1)
+            progress.update(overall_task_id, advance=1)
         except Exception:
             pass
+        job_queue.task_done()
 
-        safe_prefix = sanitize_filename(f"{song.index:02d} - ")
-        outtmpl = os.path.join(song.folder, f"{safe_prefix}%(title)s.%(ext)s")
-
-        hook = WorkerDownloadHook(progress, worker_task_id)
-        ydl_opts = {
-            "format": "bestaudio/best",
-            "outtmpl": os.path.join(song.folder, f"{safe_prefix}%(title)s.%(ext)s"),
-            "postprocessors": [{
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "opus",
-            }],
-            "quiet": True,
-            "no_warnings": True,
-            "ignoreerrors": False,
-            "progress_hooks": [hook],
-        }
-
-        success = False
-        for attempt in range(1, 4):
-            try:
-                def _dl():
-                    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                        info = ydl.extract_info(song.url, download=True)
-                        if info is None:
-                            raise RuntimeError("yt_dlp returned None.")
-                        return info, ydl
+    ydl_opts = {
+        # An Opus source lets FFmpegExtractAudio remux into .opus instead of
+        # transcoding; other codecs are only picked when no Opus stream exists.
+        "format": "bestaudio[acodec=opus]/bestaudio/best",
+        "ffmpeg_location": FFMPEG,
+        "postprocessors": [{
+            "key": "FFmpegExtractAudio",
+            "preferredcodec": "opus",
+        }],
+        "quiet": True,
+        "no_warnings": True,
+        "ignoreerrors": False,
+        "progress_hooks": [hook],
+        **download_opts,
+    }
 
-                info, ydl_instance = retry_request(_dl, max_retries=2)
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        while True:
+            song: Optional[SongTask] = job_queue.get()
+            if song is None:
+                # One sentinel per worker marks the end of the queue.
+                job_queue.task_done()
+                return
 
-                final_path = ydl_instance.prepare_filename(info)
-                full_path = os.path.splitext(final_path)[0] + ".opus"
+            desc_title = song.title_hint or song.url
+            short_desc = f"W{worker_id} {song.index}/{song.playlist_total} {desc_title}"
+            try:
+                progress.update(worker_task_id, description=short_desc, completed=0, total=1)
+            except Exception:
+                pass
 
-                if not os.path.isfile(full_path) or os.path.getsize(full_path) < 1024:
-                    raise RuntimeError("Downloaded file missing or too small.")
+            safe_prefix = sanitize_filename(f"{song.index:02d} - ")
+            ydl.params["outtmpl"]["default"] = os.path.join(song.folder, f"{safe_prefix}%(title)s.%(ext)s")
 
+            success = False
+            for attempt in range(1, 4):
                 try:
-                    progress.update(worker_task_id, description=f"{short_desc} • tagging (MusicBrainz)")
-                except Exception:
+                    def _dl():
+                        hook.reset()
+                        # Only the YouTube leg holds a slot (and not while
+                        # backing off or pacing); tagging talks to other hosts.
+                        # The YouTube bucket is charged once per track,
+                        # covering both the extraction and the download below.
+                        RATE_LIMITER.wait(YOUTUBE_HOST)
+                        with youtube_slots:
+                            info = ydl.extract_info(song.url, download=False)
+                        if info is None:
+                            raise RuntimeError("yt_dlp returned None.")
+                        # Plain video URLs are not probed, so the title is
+                        # only known from here on.
+                        if not song.title_hint and info.get("title"):
+                            try:
+                                progress.update(worker_task_id, description=f"W{worker_id} {song.index}/{song.playlist_total} {info['title']}")
+                            except Exception:
+                                pass
+                        # A file an earlier run already finished is kept; it
+                        # only goes through tagging for whatever is missing.
+                        existing = os.path.splitext(ydl.prepare_filename(info))[0] + ".opus"
+                        if is_finished_download(existing):
+                            return info, existing, None
+                        prefetched = prefetch_lookups(lookup_pool, info, cover_size)
+                        with youtube_slots:
+                            info = ydl.process_ie_result(info, download=True)
+                        # requested_downloads carries the path after FFmpegExtractAudio
+                        # ran, so there is no need to guess the extension.
+                        downloads = info.get("requested_downloads") or []
+                        return info, (downloads[0].get("filepath") if downloads else None) or existing, prefetched
+
+                    info, full_path, prefetched = retry_request(_dl, max_retries=2)
+
+                    if not is_valid_file(full_path):
+                        raise RuntimeError("Downloaded file missing or too small.")
+
+                    success = True
+                    break
+
+                except Exception as e:
+                    console.print(f"[red]Worker {worker_id} attempt {attempt} failed for {song.url}: {e}[/red]")
+                    if attempt < 3 and is_retryable(e):
+                        time.sleep(backoff_delay(attempt, base=2.0))
+                        try:
+                            progress.update(worker_task_id, completed=0, total=1)
+                        except Exception:
+                            pass
+                        continue
+                    else:
+                        console.print(f"[bold red]Worker {worker_id} giving up on {song.url}[/bold red]")
+                        break
+                finally:
                     pass
 
+            if success:
+                # Tagging talks to other hosts; hand it off so this worker can
+                # start the next download. The slots cap how many finished
+                # downloads may wait for tags before the worker blocks.
+                tag_slots.acquire()
                 try:
-                    insert_metadata(full_path, info, song.index)
+                    tagged = tag_pool.submit(insert_metadata, full_path, info, song.index, cover_size, prefetched)
                 except Exception:
-                    pass
-
-                success = True
-                break
-
-            except Exception as e:
-                console.print(f"[red]Worker {worker_id} attempt {attempt} failed for {song.url}: {e}[/red]")
-                if attempt < 3:
-                    time.sleep(2 ** attempt)
-                    try:
-                        progress.update(worker_task_id, completed=0, total=1)
-                    except Exception:
-                        pass
-                    continue
+                    tag_slots.release()
+                    finish(song)
                 else:
-                    console.print(f"[bold red]Worker {worker_id} giving up on {song.url}[/bold red]")
-            finally:
-                pass
-        try:
-            progress.update(overall_task_id, advance=1)
-        except Exception:
-            pass
-
-        try:
-            progress.update(worker_task_id, description=f"[grey58]Worker {worker_id} idle[/grey58]", completed=0, total=1)
-        except Exception:
-            pass
+                    tagged.add_done_callback(functools.partial(finish, song))
+            else:
+                finish(song)
 
-        job_queue.task_done()
+            try:
+                progress.update(worker_task_id, description=f"[grey58]Worker {worker_id} idle[/grey58]", completed=0, total=1)
+            except Exception:
+                pass
 
 def main():
     default_workers = min(4, (os.cpu_count() or 2))
@@ -575,9 +1246,72 @@ def main():
         default=default_workers,
         help="Number of concurrent download workers"
     )
+    parser.add_argument(
+        "--youtube-connections",
+        type=int,
+        default=4,
+        help="Maximum number of simultaneous YouTube downloads across all workers"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="count",
+        default=0,
+        help="Show retry details (-v) and per-request debug output (-vv)"
+    )
+    parser.add_argument(
+        "--concurrent-fragments",
+        type=int,
+        default=4,
+        help="Number of fragments of a single DASH/HLS stream to download in parallel"
+    )
+    parser.add_argument(
+        "--aria2c",
+        action="store_true",
+        help="Use aria2c as the external downloader when it is installed"
+    )
+    parser.add_argument(
+        "--skip-webpage",
+        action="store_true",
+        help="Skip fetching each video's watch page during extraction (fewer requests, less robust)"
+    )
+    parser.add_argument(
+        "--url-parallel",
+        type=int,
+        default=4,
+        help="Number of input URLs/playlists to expand concurrently"
+    )
+    parser.add_argument(
+        "--domain-delay-ms",
+        type=int,
+        default=DEFAULT_DOMAIN_DELAY_MS,
+        help="Average delay between requests to the same host; YouTube is paced per track and per probed URL (0 disables)"
+    )
+    parser.add_argument(
+        "--domain-burst",
+        type=int,
+        default=DEFAULT_DOMAIN_BURST,
+        help="Number of back-to-back requests allowed to one host before --domain-delay-ms spacing applies"
+    )
+
+    parser.add_argument(
+        "--cover-size",
+        type=int,
+        default=DEFAULT_COVER_SIZE,
+        help="Edge length in pixels of the embedded Apple Music cover art (e.g. 1400 for full size)"
+    )
 
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose > 1 else logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_path=False)],
+    )
+    # Keep third-party chatter out of -v; only -vv shows everything.
+    if args.verbose < 2:
+        for noisy in ("urllib3", "musicbrainzngs"):
+            logging.getLogger(noisy).setLevel(logging.WARNING)
+
     console.print(Panel.fit("[bold cyan]YouTube Downloader[/bold cyan]", border_style="cyan"))
 
     urls: List[str] = list(args.urls)
@@ -594,19 +1328,32 @@ def main():
         console.print("\n[red]Error: No URLs provided. Please provide URLs directly or via a batch file.[/red]")
         sys.exit(1)
 
+    if not FFMPEG:
+        console.print("[red]Error: 'ffmpeg' binary not found in PATH. It is required to extract the audio.[/red]")
+        sys.exit(1)
+    # Fingerprinting only runs with an AcoustID key configured.
+    if ACOUSTID_API_KEY and not FPCALC:
+        console.print("[yellow]Warning: 'fpcalc' binary not found in PATH. Cannot generate fingerprint.[/yellow]")
+
     output_dir = args.output_dir
     os.makedirs(output_dir, exist_ok=True)
 
     MAX_WORKERS = max(1, args.workers)
+    size_session_pool(MAX_WORKERS)
+    RATE_LIMITER.configure(args.domain_delay_ms, args.domain_burst)
+    youtube_slots = threading.BoundedSemaphore(max(1, args.youtube_connections))
+    download_opts = downloader_options(args.concurrent_fragments, args.aria2c, args.skip_webpage)
 
     console.print(f"[green]Preparing tasks and expanding playlists...[/green]")
-    tasks = build_task_list(urls, output_dir)
+    tasks = build_task_list(urls, output_dir, youtube_slots, args.url_parallel)
     total_tracks = len(tasks)
     console.print(f"[green]Total tracks to process:[/green] {total_tracks}")
 
     job_queue: Queue = Queue()
     for t in tasks:
         job_queue.put(t)
+    for _ in range(MAX_WORKERS):
+        job_queue.put(None)
 
     progress = Progress(
         SpinnerColumn(),
@@ -616,6 +1363,7 @@ def main():
         DownloadColumn(),
         TimeRemainingColumn(),
         console=console,
+        refresh_per_second=4,
     )
 
     try:
@@ -626,18 +1374,28 @@ def main():
                 tid = progress.add_task(f"[grey58]Worker {wid} idle[/grey58]", total=1)
                 worker_task_ids.append(tid)
 
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                futures = []
-                for i, tid in enumerate(worker_task_ids, start=1):
-                    futures.append(executor.submit(worker_loop, i, job_queue, progress, tid, overall_task_id))
-
-                for f in as_completed(futures):
-                    try:
-                        f.result()
-                    except Exception as e:
-                        console.print(f"[red]Worker thread exception: {e}[/red]")
-
-            job_queue.join()
+            tag_slots = threading.BoundedSemaphore(2 * MAX_WORKERS)
+            # Prefetches get their own pool: tagging jobs wait on them, so
+            # sharing tag_pool could leave every tag thread waiting on work
+            # queued behind it.
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as tag_pool, \
+                    ThreadPoolExecutor(max_workers=2 * MAX_WORKERS) as lookup_pool:
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    futures = []
+                    for i, tid in enumerate(worker_task_ids, start=1):
+                        futures.append(executor.submit(
+                            worker_loop, i, job_queue, progress, tid, overall_task_id, youtube_slots, download_opts,
+                            tag_pool, tag_slots, lookup_pool, max(1, args.cover_size)
+                        ))
+
+                    for f in as_completed(futures):
+                        try:
+                            f.result()
+                        except Exception as e:
+                            console.print(f"[red]Worker thread exception: {e}[/red]")
+                # No job_queue.join(): a worker that died before taking its
+                # sentinel would leave it queued forever. Leaving the tag_pool
+                # block waits for the remaining tagging instead.
 
     except KeyboardInterrupt:
         console.print("\n[red]Cancelled by user[/red]")